@@ -1,19 +1,42 @@
+import inspect
+import threading
 import warnings
 from datetime import date
-from enum import Enum
+from enum import Enum, IntFlag
 from functools import cached_property, wraps
-from typing import Any, Dict, Generator, List, Optional, Tuple, Type, TypeVar, Union
+from itertools import islice, product
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-import forge
 from django.db import connections, models
+from django.db.models import prefetch_related_objects
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor,
+    ManyToManyDescriptor,
+    ReverseManyToOneDescriptor,
+)
+from django.db.models.query_utils import DeferredAttribute
 from django.db.transaction import atomic
 from djdantic.schemas import Access, Error
 from djdantic.schemas.access import AccessScope
-from djdantic.utils.dict import remove_none
 from djdantic.utils.pydantic import (
     IdAddedModel,
     OptionalModel,
     ReferencedModel,
+    get_orm_field_attr,
     id_added_model,
     include_reference,
     optional_model,
@@ -25,13 +48,15 @@ from fastapi._compat import _normalize_errors
 from fastapi.dependencies.utils import analyze_param, request_params_to_args
 from fastapi.exceptions import RequestValidationError
 from fastapi.security.base import SecurityBase
-from pydantic import constr, create_model
-from pydantic.fields import ModelField, Undefined, UndefinedType
+from pydantic import BaseModel, constr, create_model
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.fields import SHAPE_SINGLETON, ModelField, Undefined, UndefinedType
+from pydantic.utils import lenient_issubclass
 from starlette.status import HTTP_204_NO_CONTENT
 
 from ..exceptions import AccessError, ValidationError
 from ..schemas import errors as error_schemas
-from ..utils.fastapi import Pagination, depends_pagination
+from ..utils.fastapi import Pagination, depends_pagination, kwarg, sign
 from ..utils.fastapi_django import AggregateResponse, AggregationFunction, aggregation, request_signalling
 from . import Method, RouterSchema, SecurityScopes  # noqa  # import SecurityScopes for user friendly import
 from .base import TBaseModel, TCreateModel, TUpdateModel
@@ -42,6 +67,94 @@ TDjangoModel = TypeVar('TDjangoModel', bound=models.Model)
 
 _list_models = {}
 _generated_enums = {}
+_search_filter_fields = {}
+_referenced_models = {}
+_cockroach_databases = {}
+_router_lock = threading.RLock()
+_field_class_kinds = {}
+
+_CACHED_METHODS = frozenset((Method.GET, Method.GET_LIST, Method.GET_AGGREGATE))
+
+
+def _get_lookups(q: models.Q) -> Generator[str, None, None]:
+    for child in q.children:
+        if isinstance(child, models.Q):
+            yield from _get_lookups(child)
+
+        elif isinstance(child, tuple):
+            yield child[0]
+
+
+def _is_cockroach(alias: str) -> bool:
+    if alias not in _cockroach_databases:
+        _cockroach_databases[alias] = connections.databases[alias]['ENGINE'] == 'django_cockroachdb'
+
+    return _cockroach_databases[alias]
+
+
+class FieldKind(IntFlag):
+    NUMERIC = 1
+    DATE = 2
+    CHAR = 4
+    FOREIGN_KEY = 8
+    MANY_TO_MANY = 16
+    RELATED = 32
+    CHOICES = 64
+    INTEGER = 128
+    DATETIME = 256
+
+
+# kinds of fields with `__gte` / `__lte` search fields
+_RANGE_FIELD_KINDS = FieldKind.NUMERIC | FieldKind.DATE | FieldKind.RELATED
+
+
+def _get_field_class_kind(field_class: Type) -> FieldKind:
+    if issubclass(field_class, (models.IntegerField, models.FloatField, models.DecimalField)):
+        kind = FieldKind.NUMERIC
+        if issubclass(field_class, models.IntegerField):
+            kind |= FieldKind.INTEGER
+
+    elif issubclass(field_class, (models.DateField, models.DateTimeField)):
+        kind = FieldKind.DATE
+        if issubclass(field_class, models.DateTimeField):
+            kind |= FieldKind.DATETIME
+
+    elif issubclass(field_class, models.CharField):
+        kind = FieldKind.CHAR
+
+    elif issubclass(field_class, models.ForeignKey):
+        kind = FieldKind.FOREIGN_KEY
+
+    elif issubclass(field_class, models.ManyToManyField):
+        kind = FieldKind.MANY_TO_MANY
+
+    elif issubclass(field_class, (models.ManyToManyRel, models.ManyToOneRel)):
+        kind = FieldKind.RELATED
+
+    else:
+        kind = FieldKind(0)
+
+    return kind
+
+
+def _get_field_kind(field) -> FieldKind:
+    """
+    Kind of a model field, the kind of each field class is only resolved once
+    """
+    field_class = type(field)
+    if field_class not in _field_class_kinds:
+        _field_class_kinds[field_class] = _get_field_class_kind(field_class)
+
+    kind = _field_class_kinds[field_class]
+    if getattr(field, 'choices', None):
+        kind |= FieldKind.CHOICES
+
+    return kind
+
+
+class ModelFieldPartitions(NamedTuple):
+    numeric_fields: Tuple[Enum, ...]
+    many_to_many_fields: Tuple[Enum, ...]
 
 
 class DjangoRouterSchema(RouterSchema):
@@ -54,6 +167,10 @@ class DjangoRouterSchema(RouterSchema):
     update: Union[Type[TUpdateModel], UndefinedType] = None
     delete_status: Optional[Any] = None
     pagination_options: dict = {}
+    list_chunk_size: int = 2000
+    model_fields_max_depth: Optional[int] = None
+    fast_read: bool = False
+    list_only_fields: bool = True
     aggregate_fields: Optional[Union[Type[Enum], UndefinedType]] = None
     aggregate_group_by: Optional[Type[Enum]] = None
     register_router: Optional[Tuple[list, dict]] = None
@@ -67,7 +184,8 @@ class DjangoRouterSchema(RouterSchema):
             raise NotImplementedError("create_multi is not supported for DjangoRouterSchema")
 
         if self.register_router:
-            self._create_router()
+            # the router is created when the registered routers are included into the app, see `include_routers`
+            register_router(self, *self.register_router[0], **self.register_router[1])
 
     def _init_list(self):
         if not self.get in _list_models:
@@ -99,60 +217,136 @@ class DjangoRouterSchema(RouterSchema):
 
     @cached_property
     def model_fields(self) -> Enum:
-        def _get_model_fields(model, prefix='', recursion_tree=None):
-            if recursion_tree is None:
-                recursion_tree = []
+        max_depth = self.model_fields_max_depth
+
+        def _get_model_fields(model):
+            # depth first, every entry keeps the models on its path to skip cyclic relations
+            stack = [(iter(model._meta.get_fields(include_parents=False)), '', (model,))]
+            while stack:
+                fields, prefix, path = stack[-1]
+                field = next(fields, None)
+                if field is None:
+                    stack.pop()
+                    continue
 
-            for field in model._meta.get_fields(include_parents=False):
                 yield f'{prefix}{field.name}', field
 
-                if isinstance(
+                if not isinstance(
                     field, (models.ForeignKey, models.ManyToManyField, models.ManyToOneRel, models.ManyToManyRel)
                 ):
-                    if self.parent and field.related_model == self.parent.model:
-                        continue
+                    continue
+
+                if self.parent and field.related_model == self.parent.model:
+                    continue
 
-                    if field.related_model is model:
-                        continue
+                if field.related_model in path:
+                    continue
 
-                    if field.related_model in recursion_tree:
-                        continue
+                if max_depth is not None and len(path) > max_depth:
+                    continue
 
-                    yield from _get_model_fields(
-                        field.related_model,
-                        prefix=prefix + field.name + '__',
-                        recursion_tree=[*recursion_tree, model],
+                stack.append(
+                    (
+                        iter(field.related_model._meta.get_fields(include_parents=False)),
+                        prefix + field.name + '__',
+                        (*path, field.related_model),
                     )
+                )
 
-        if (self.model, 'Fields') not in _generated_enums:
-            _generated_enums[self.model, 'Fields'] = Enum(
-                f'{self.model.__name__}Fields', {field: ref for field, ref in _get_model_fields(self.model)}
+        key = self._generated_enum_key('Fields')
+        if key not in _generated_enums:
+            _generated_enums[key] = Enum(
+                self._generated_enum_name('Fields'), {field: ref for field, ref in _get_model_fields(self.model)}
             )
 
-        return _generated_enums[self.model, 'Fields']
+        return _generated_enums[key]
+
+    def _generated_enum_key(self, suffix: str) -> tuple:
+        # fields related to the parent model are excluded, therefore the enums depend on the parent as well
+        return (self.model, self.parent.model if self.parent else None, self.model_fields_max_depth, suffix)
+
+    def _generated_enum_name(self, suffix: str) -> str:
+        # distinct names per key, the names end up as schema names in the openapi spec
+        name = self.model.__name__
+        if self.parent:
+            name = self.parent.model.__name__ + name
+
+        if self.model_fields_max_depth is not None:
+            name += f'Depth{self.model_fields_max_depth}'
+
+        return name + suffix
 
     @cached_property
-    def order_fields(self):
-        fields = []
-        for field in self.model_fields:
-            name = field._name_
-            if isinstance(field.value, (models.ManyToManyRel, models.ManyToOneRel)):
-                name += '__count'
-
-            fields.append(name)
-            fields.append('-' + name)
-
-        if (self.model, 'OrderFields') not in _generated_enums:
-            _generated_enums[self.model, 'OrderFields'] = Enum(
-                f'{self.model.__name__}OrderFields', {field: field for field in fields}
-            )
+    def _field_index(self) -> Dict[str, Tuple[Enum, FieldKind]]:
+        """
+        Members of `model_fields` with the kind of their model field, classified in a single pass
+        """
+        return {field._name_: (field, _get_field_kind(field.value)) for field in self.model_fields}
 
-        return _generated_enums[self.model, 'OrderFields']
+    @cached_property
+    def _meta_partitions(self) -> ModelFieldPartitions:
+        """
+        Members of `model_fields` annotated by `_generate_annotations`, partitioned by the kind of their model field
+        """
+        partitions = {key: [] for key in ModelFieldPartitions._fields}
+        for field, kind in self._field_index.values():
+            if kind & FieldKind.NUMERIC:
+                partitions['numeric_fields'].append(field)
+
+            elif kind & FieldKind.MANY_TO_MANY:
+                partitions['many_to_many_fields'].append(field)
+
+        return ModelFieldPartitions(**{key: tuple(fields) for key, fields in partitions.items()})
+
+    @cached_property
+    def _field_enum_members(self) -> Dict[str, Dict[str, str]]:
+        """
+        Members of the order, aggregate and group by enums, collected in a single pass over the model fields
+        """
+        order_fields = {}
+        aggregate_fields = {'_count': '*'}
+        group_by_fields = {}
+        for name, (field, kind) in self._field_index.items():
+            order_name = f'{name}__count' if kind & FieldKind.RELATED else name
+            order_fields[order_name] = order_name
+            order_fields['-' + order_name] = '-' + order_name
+
+            # TODO only include Charfield if aggregate function is count
+            if kind & (FieldKind.NUMERIC | FieldKind.RELATED | FieldKind.CHAR):
+                aggregate_fields[name] = name
+
+            if (kind & FieldKind.CHAR and kind & FieldKind.CHOICES) or kind & FieldKind.FOREIGN_KEY:
+                group_by_fields[name] = name
+
+            if kind & FieldKind.DATE:
+                for field_name, _field_type in self._get_field_variations(field.value):
+                    group_by_fields[field_name] = field_name
+
+        return {
+            'OrderFields': order_fields,
+            'AggregateFields': aggregate_fields,
+            'GroupByFields': group_by_fields,
+        }
+
+    def _get_fields_enum(self, suffix: str) -> Enum:
+        key = self._generated_enum_key(suffix)
+        if key not in _generated_enums:
+            _generated_enums[key] = Enum(self._generated_enum_name(suffix), self._field_enum_members[suffix])
+
+        return _generated_enums[key]
+
+    @cached_property
+    def order_fields(self):
+        return self._get_fields_enum('OrderFields')
 
     @cached_property
     def get_referenced(self):
         if not issubclass(self.get, ReferencedModel):
-            return include_reference()(self.get)
+            # include_reference walks all nested models before looking up its cache, shared get schemas are walked once
+            if self.get not in _referenced_models:
+                _referenced_models[self.get] = include_reference()(self.get)
+
+            return _referenced_models[self.get]
 
         return self.get
 
@@ -173,61 +367,46 @@ class DjangoRouterSchema(RouterSchema):
         if self.aggregate_fields:
             return self.aggregate_fields
 
-        fields = {
-            '_count': '*',
+        return self._get_fields_enum('AggregateFields')
+
+    @cached_property
+    def _valid_aggregations(self) -> Set[Tuple[AggregationFunction, Enum]]:
+        """
+        Combinations of aggregation function and aggregated field which can be aggregated
+        """
+        return {
+            (function, field)
+            for function, field in product(AggregationFunction, self.aggregated_fields)
+            # the kind of custom aggregate fields is unknown, invalid combinations are left to the database
+            if self.aggregate_fields or self._is_valid_aggregation(function, field)
         }
-        fields.update(
-            {
-                field._name_: field._name_
-                for field in self.model_fields
-                if isinstance(
-                    field.value,
-                    (
-                        models.IntegerField,
-                        models.FloatField,
-                        models.DecimalField,
-                        models.ManyToManyRel,
-                        models.ManyToOneRel,
-                        # TODO only include Charfield if aggregate function is count
-                        models.CharField,
-                    ),
-                )
-            }
-        )
-        if (self.model, 'AggregateFields') not in _generated_enums:
-            _generated_enums[self.model, 'AggregateFields'] = Enum(f'{self.model.__name__}AggregateFields', fields)
 
-        return _generated_enums[self.model, 'AggregateFields']
+    def _is_valid_aggregation(self, function: AggregationFunction, field: Enum) -> bool:
+        if field.value == '*':
+            return function == AggregationFunction.count
+
+        if field.value not in self._field_index:
+            # not a field of this router, its validity is left to the database
+            return True
+
+        _field, kind = self._field_index[field.value]
+        if kind & FieldKind.CHAR:
+            return function in (AggregationFunction.count, AggregationFunction.min, AggregationFunction.max)
+
+        return True
 
     @cached_property
     def get_aggregate_group_by(self) -> Enum:
         if self.aggregate_group_by:
             return self.aggregate_group_by
 
-        def generate_group_by_fields():
-            for field in self.model_fields:
-                if isinstance(field.value, models.CharField) and field.value.choices:
-                    yield field._name_
-
-                if isinstance(field.value, models.ForeignKey):
-                    yield field._name_
-
-                if isinstance(field.value, (models.DateField, models.DateTimeField)):
-                    for field_name, _field_type in self._get_field_variations(field.value):
-                        yield field_name
-
-        if (self.model, 'GroupByFields') not in _generated_enums:
-            _generated_enums[self.model, 'GroupByFields'] = Enum(
-                f'{self.model.__name__}GroupByFields',
-                {field_name: field_name for field_name in generate_group_by_fields()},
-            )
-
-        return _generated_enums[self.model, 'GroupByFields']
+        return self._get_fields_enum('GroupByFields')
 
     @property
     def router(self) -> APIRouter:
-        if not self.__router:
-            self._create_router()
+        with _router_lock:
+            if not self.__router:
+                self._create_router()
 
         return self.__router
 
@@ -261,9 +440,6 @@ class DjangoRouterSchema(RouterSchema):
         for child in self.children:
             self.__router.include_router(child.router)
 
-        if self.register_router:
-            register_router(self.__router, *self.register_router[0], **self.register_router[1])
-
     def _additional_responses(self, method: Method):
         responses = {}
         if method in (Method.GET, Method.PATCH, Method.PUT, Method.DELETE) or self.parent:
@@ -351,38 +527,208 @@ class DjangoRouterSchema(RouterSchema):
             responses=self._additional_responses(Method.DELETE),
         )
 
-    def _generate_annotations(self):
-        for field in self.model_fields:
-            if isinstance(field.value, (models.IntegerField, models.FloatField, models.DecimalField)):
-                yield models.Sum(field.name)
-                yield models.Avg(field.name)
-                yield models.Min(field.name)
-                yield models.Max(field.name)
+    def _generate_annotations(self, lookups: Optional[Set[str]] = None):
+        """
+        Aggregations of related fields to filter on, when lookups are given only those used by the lookups.
+        Each annotation joins the related table, so superfluous ones multiply the rows of the query.
+        """
+        partitions = self._meta_partitions
+        for fields, functions in (
+            (partitions.numeric_fields, (models.Sum, models.Avg, models.Min, models.Max)),
+            (partitions.many_to_many_fields, (models.Count,)),
+        ):
+            for field, function in product(fields, functions):
+                alias = f'{field.name}__{function.name.lower()}'
+                if lookups is not None and not any(
+                    lookup == alias or lookup.startswith(alias + '__') for lookup in lookups
+                ):
+                    continue
+
+                if function is models.Count:
+                    yield function(field.name, distinct=True)
+
+                else:
+                    yield function(field.name)
+
+    @cached_property
+    def _parent_lookup(self) -> str:
+        """
+        Lookup from the model to the parent model, derived from the relation on the parent
+        """
+        field = self.parent.model._meta.get_field(self.related_name_on_parent)
+        if isinstance(field, models.ForeignObjectRel):
+            return field.field.name
+
+        return field.related_query_name()
+
+    @cached_property
+    def _select_related(self) -> Tuple[str, ...]:
+        """
+        Lookups of the foreign keys read when transferring an object to the `get` schema, see `transfer_from_orm`.
+
+        Related lists are read by filtering the related managers, which would not use any prefetched objects,
+        therefore only foreign keys are selected related.
+        """
+
+        def _get_select_related(schema: Type[BaseModel], prefix='', recursion_tree=None):
+            if recursion_tree is None:
+                recursion_tree = []
+
+            for field in schema.__fields__.values():
+                if field.shape != SHAPE_SINGLETON or not lenient_issubclass(field.type_, BaseModel):
+                    continue
+
+                if field.type_ in recursion_tree or get_orm_field_attr(field.field_info, 'orm_method'):
+                    continue
 
-            if isinstance(field.value, models.ManyToManyField):
-                yield models.Count(field.name)
+                orm_field = get_orm_field_attr(field.field_info, 'orm_field')
+                if orm_field is Undefined or (orm_field is None and 'orm_field' in field.field_info.extra):
+                    continue
+
+                if orm_field is None:
+                    # submodel of the same object
+                    yield from _get_select_related(field.type_, prefix, [*recursion_tree, schema])
+
+                elif isinstance(orm_field, (ForwardManyToOneDescriptor, DeferredAttribute)) and (
+                    orm_field.field.many_to_one or orm_field.field.one_to_one
+                ):
+                    lookup = prefix + orm_field.field.name
+                    yield lookup
+                    yield from _get_select_related(field.type_, lookup + '__', [*recursion_tree, schema])
+
+        return tuple(dict.fromkeys(_get_select_related(self.get)))
+
+    @cached_property
+    def _only_fields(self) -> Optional[Tuple[str, ...]]:
+        """
+        Model fields read when transferring an object to the response schema, lists only fetch their columns
+        unless `list_only_fields` is disabled.
+        None if the schema reads values which can not be traced to model fields (properties, `orm_method`, scopes).
+        """
+
+        def _get_only_fields(schema: Type[BaseModel], recursion_tree=None):
+            if recursion_tree is None:
+                recursion_tree = []
+
+            for field in schema.__fields__.values():
+                if get_orm_field_attr(field.field_info, 'orm_method') or get_orm_field_attr(field.field_info, 'scopes'):
+                    yield None
+                    continue
+
+                orm_field = get_orm_field_attr(field.field_info, 'orm_field')
+                if orm_field is Undefined or (orm_field is None and 'orm_field' in field.field_info.extra):
+                    continue
+
+                if orm_field is None:
+                    if field.shape != SHAPE_SINGLETON or field.type_ in recursion_tree:
+                        yield None
+
+                    else:
+                        # submodel of the same object
+                        yield from _get_only_fields(field.type_, [*recursion_tree, schema])
+
+                elif isinstance(orm_field, (ForwardManyToOneDescriptor, DeferredAttribute)):
+                    # related objects are selected or prefetched as a whole, only the foreign key is needed
+                    yield orm_field.field.name
+
+                elif not isinstance(orm_field, (ReverseManyToOneDescriptor, ManyToManyDescriptor)):
+                    yield None
+
+        fields = set(_get_only_fields(self.get_referenced))
+        concrete_fields = [field.name for field in self.model._meta.concrete_fields]
+        if None in fields or not fields.issubset(concrete_fields) or fields.issuperset(concrete_fields):
+            return None
+
+        return tuple(field for field in concrete_fields if field in fields)
+
+    @cached_property
+    def _fast_read_attributes(self) -> Optional[Tuple[Tuple[str, str], ...]]:
+        """
+        Pairs of schema field and model attribute when the `get` schema only reads plain model fields.
+        None if the schema has to be transferred by `transfer_from_orm` (submodels, lists, properties, scopes, ...).
+        """
+        attributes = []
+        for field in self.get_referenced.__fields__.values():
+            if get_orm_field_attr(field.field_info, 'orm_method') or get_orm_field_attr(field.field_info, 'scopes'):
+                return None
+
+            orm_field = get_orm_field_attr(field.field_info, 'orm_field')
+            if orm_field is Undefined or (orm_field is None and 'orm_field' in field.field_info.extra):
+                continue
+
+            if (
+                field.shape != SHAPE_SINGLETON
+                or lenient_issubclass(field.type_, BaseModel)
+                or not isinstance(orm_field, DeferredAttribute)
+                or isinstance(orm_field.field, models.JSONField)
+            ):
+                return None
+
+            attributes.append((field.name, orm_field.field.attname))
+
+        return tuple(attributes)
+
+    def _read_object(self, obj: TDjangoModel) -> TBaseModel:
+        """
+        Transfers an object to the `get` schema, flat schemas are constructed directly when `fast_read` is enabled
+        """
+        if self.fast_read and self._fast_read_attributes is not None:
+            return self.get_referenced.construct(
+                **{name: getattr(obj, attname) for name, attname in self._fast_read_attributes}
+            )
+
+        return self.get_referenced.from_orm(obj)
+
+    @cached_property
+    def _prefetch_related(self) -> Tuple[str, ...]:
+        """
+        Lookups of `_select_related` towards the parent. All objects of a list share the same parent, therefore it is
+        fetched once for the whole list instead of being joined to every row.
+        """
+        if not self.parent:
+            return ()
+
+        return tuple(
+            lookup
+            for lookup in self._select_related
+            if lookup == self._parent_lookup or lookup.startswith(self._parent_lookup + '__')
+        )
+
+    @cached_property
+    def _list_select_related(self) -> Tuple[str, ...]:
+        return tuple(lookup for lookup in self._select_related if lookup not in self._prefetch_related)
 
     def get_queryset(
         self,
         parent_ids: Optional[List[str]] = None,
         access: Optional[Access] = None,
         pagination: Optional[Pagination] = None,
-        is_annotated: bool = False,
+        is_annotated: Union[bool, Set[str]] = False,
         is_aggregated: bool = False,
+        for_list: bool = False,
     ):
         objects = self.model.objects
         if self.parent:
+            # filter on the (lazy) parent queryset, the whole parent chain is resolved within a single query
             parent_objects = self.parent.get_queryset(parent_ids[:-1], access, is_annotated=False, is_aggregated=False)
-            parent = parent_objects.get(pk=parent_ids[-1])
-            objects = getattr(parent, self.related_name_on_parent)
+            objects = objects.filter(**{f'{self._parent_lookup}__in': parent_objects.filter(pk=parent_ids[-1])})
 
-        queryset = objects.filter(self.objects_filter(access))
+        # filtering on an empty Q would still clone the queryset and walk the empty filter tree
+        security_filter = self.objects_filter(access)
+        queryset = objects.filter(security_filter) if security_filter else objects.all()
         distinct_fields = []
 
         if is_annotated:
-            queryset = queryset.annotate(*self._generate_annotations())
+            queryset = queryset.annotate(*self._generate_annotations(None if is_annotated is True else is_annotated))
 
-        if not is_aggregated and connections.databases[queryset.db]['ENGINE'] == 'django_cockroachdb':
+        select_related = self._list_select_related if for_list else self._select_related
+        if not is_aggregated and select_related:
+            queryset = queryset.select_related(*select_related)
+
+        if for_list and self.list_only_fields and self._only_fields:
+            queryset = queryset.only(*self._only_fields)
+
+        if not is_aggregated and _is_cockroach(queryset.db):
             # cockroachdb returns multiple rows when searching on related fields, therefore perform a distinct on the primary key
             distinct_fields.append('id')
 
@@ -391,11 +737,15 @@ class DjangoRouterSchema(RouterSchema):
 
         return queryset
 
+    @cached_property
+    def _has_tenant(self) -> bool:
+        return hasattr(self.model, 'tenant_id')
+
     def objects_filter(self, access: Optional[Access] = None) -> models.Q:
         """
         Method used for security filtering, override to add additional filters based on the given user.
         """
-        if hasattr(self.model, 'tenant_id'):
+        if self._has_tenant:
             return models.Q(tenant_id=access.tenant_id)
 
         return models.Q()
@@ -407,50 +757,130 @@ class DjangoRouterSchema(RouterSchema):
         access: Optional[Access] = None,
         search: models.Q = models.Q(),
         pagination: Pagination,
-    ) -> List[TDjangoModel]:
-        return list(pagination.query(self.get_queryset(parent_ids, access, pagination=pagination).filter(search)))
+    ) -> Iterable[TDjangoModel]:
+        """
+        Objects of the requested page, pages larger than `list_chunk_size` are streamed in chunks of that size
+        """
+        queryset = pagination.query(
+            self.get_queryset(parent_ids, access, pagination=pagination, for_list=True).filter(search)
+        )
+        if pagination.limit - pagination.offset > self.list_chunk_size:
+            return self._objects_iterate_chunks(queryset, parent_ids=parent_ids, access=access)
+
+        objects = list(queryset)
+        if objects:
+            prefetch_related_objects(objects, *self._prefetch_related)
+
+        elif self.parent:
+            self._check_parent_exists(parent_ids, access=access)
+
+        return objects
+
+    def _objects_iterate_chunks(
+        self, queryset: models.QuerySet, parent_ids: List[str], access: Optional[Access] = None
+    ) -> Iterator[TDjangoModel]:
+        iterator = queryset.iterator(chunk_size=self.list_chunk_size)
+        is_empty = True
+        while objects := list(islice(iterator, self.list_chunk_size)):
+            is_empty = False
+            prefetch_related_objects(objects, *self._prefetch_related)
+            yield from objects
+
+        if is_empty and self.parent:
+            self._check_parent_exists(parent_ids, access=access)
+
+    def _check_parent_exists(self, parent_ids: List[str], access: Optional[Access] = None):
+        # the parent is not fetched by get_queryset, let a missing parent still raise ObjectDoesNotExist
+        self.parent.object_get_by_id(parent_ids[-1], parent_ids=parent_ids[:-1], access=access)
 
     def object_get_by_id(
         self, id: str, parent_ids: Optional[List[str]] = None, access: Optional[Access] = None
     ) -> TDjangoModel:
-        return self.get_queryset(parent_ids, access).get(id=id)
+        try:
+            return self.get_queryset(parent_ids, access).get(id=id)
 
-    @atomic
-    def object_create(
+        except self.model.DoesNotExist:
+            if self.parent:
+                # tell a missing parent apart from a missing object
+                self._check_parent_exists(parent_ids, access=access)
+
+            raise
+
+    def _get_create_attributes(
+        self, access: Optional[Access] = None, parent_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Attributes set on every created instance before transferring the data, resolved once per create request
+        """
+        attributes = {}
+        if self._has_tenant and access:
+            attributes['tenant_id'] = access.tenant_id
+
+        if parent_id:
+            attributes[self.parent.id_field] = parent_id
+
+        return attributes
+
+    def _object_create_instance(
         self,
         *,
         access: Optional[Access] = None,
-        data: Union[TCreateModel, List[TCreateModel]],
-        parent_id: Optional[str] = None,
-    ) -> List[TDjangoModel]:
-        if not isinstance(data, list):
-            data = [data]
+        data: TCreateModel,
+        attributes: Dict[str, Any],
+    ) -> TDjangoModel:
+        instance: TDjangoModel = self.model()
+        for key, value in attributes.items():
+            setattr(instance, key, value)
+
+        transfer_to_orm(data, instance, action=TransferAction.CREATE, access=access)
+        try:
+            # Try to access newly created instance to check security rules
+            self.model.objects.filter(self.objects_filter(access)).get(
+                pk=instance.pk,
+            )
 
-        elif not self.create_multi:
-            raise ValidationError(detail=Error(code='create_multi_disabled'))
+        except self.model.DoesNotExist as error:
+            raise AccessError from error
 
-        instances = []
-        for el in data:
-            instance: TDjangoModel = self.model()
-            if hasattr(self.model, 'tenant_id') and access:
-                instance.tenant_id = access.tenant_id
+        return instance
 
-            if parent_id:
-                setattr(instance, self.parent.id_field, parent_id)
+    @atomic
+    def object_create_one(
+        self,
+        *,
+        access: Optional[Access] = None,
+        data: TCreateModel,
+        parent_id: Optional[str] = None,
+    ) -> TDjangoModel:
+        return self._object_create_instance(
+            access=access, data=data, attributes=self._get_create_attributes(access, parent_id)
+        )
 
-            transfer_to_orm(el, instance, action=TransferAction.CREATE, access=access)
-            try:
-                # Try to access newly created instance to check security rules
-                self.model.objects.filter(self.objects_filter(access)).get(
-                    pk=instance.pk,
-                )
+    def _object_create_many(
+        self,
+        *,
+        access: Optional[Access] = None,
+        data: List[TCreateModel],
+        parent_id: Optional[str] = None,
+    ) -> List[TDjangoModel]:
+        if not self.create_multi:
+            raise ValidationError(detail=Error(code='create_multi_disabled'))
 
-            except self.model.DoesNotExist as error:
-                raise AccessError from error
+        attributes = self._get_create_attributes(access, parent_id)
+        return [self._object_create_instance(access=access, data=el, attributes=attributes) for el in data]
 
-            instances.append(instance)
+    @atomic
+    def object_create(
+        self,
+        *,
+        access: Optional[Access] = None,
+        data: Union[TCreateModel, List[TCreateModel]],
+        parent_id: Optional[str] = None,
+    ) -> List[TDjangoModel]:
+        if not isinstance(data, list):
+            return [self.object_create_one(access=access, data=data, parent_id=parent_id)]
 
-        return instances
+        return self._object_create_many(access=access, data=data, parent_id=parent_id)
 
     @atomic
     def object_update(
@@ -486,12 +916,19 @@ class DjangoRouterSchema(RouterSchema):
             if method in (Method.POST, Method.PUT, Method.PATCH, Method.DELETE):
                 method = Method.PATCH
 
-            return self.parent._get_security_scopes(method)
+            return self.parent._resolved_scopes[method]
 
         return None
 
+    @cached_property
+    def _resolved_scopes(self) -> Dict[Method, Optional[List[AccessScope]]]:
+        """
+        Security scopes of every method, inherited scopes are resolved once per router
+        """
+        return {method: self._get_security_scopes(method) for method in Method}
+
     def _get_security(self, method: Method) -> Tuple[Optional[SecurityBase], Optional[List[AccessScope]]]:
-        scopes = self._get_security_scopes(method)
+        scopes = self._resolved_scopes[method]
         if not scopes:
             return None, None
 
@@ -499,39 +936,75 @@ class DjangoRouterSchema(RouterSchema):
             return self.security, scopes
 
         if self.parent:
-            return self.parent._get_security(method)[0], scopes
+            return self.parent._resolved_security[method][0], scopes
 
         return None, None
 
+    @cached_property
+    def _resolved_security(self) -> Dict[Method, Tuple[Optional[SecurityBase], Optional[List[AccessScope]]]]:
+        """
+        Security and scopes of every method, inherited security is resolved once per router
+        """
+        return {method: self._get_security(method) for method in Method}
+
     def _security_signature(self, method: Method):
-        security, scopes = self._get_security(method)
+        security, scopes = self._resolved_security[method]
         if not security:
             return
 
-        yield forge.kwarg(
+        yield kwarg(
             'access',
             type=Access,
             default=Security(security, scopes=[str(scope) for scope in scopes or []]),
         )
 
-    def _path_signature_id(self, include_self=True):
+    @cached_property
+    def _path_signature_parent_ids(self) -> Tuple[inspect.Parameter, ...]:
         if self.parent:
-            yield from self.parent._path_signature_id()
+            return self.parent._path_signature_ids
+
+        return ()
+
+    @cached_property
+    def _id_max_length(self) -> Optional[int]:
+        return self.model.id.field.max_length
 
+    @cached_property
+    def _id_path_kwarg(self) -> inspect.Parameter:
+        return kwarg(
+            self.id_field,
+            type=str,
+            default=Path(..., min_length=self._id_max_length, max_length=self._id_max_length),
+        )
+
+    @cached_property
+    def _path_signature_ids(self) -> Tuple[inspect.Parameter, ...]:
+        return (*self._path_signature_parent_ids, self._id_path_kwarg)
+
+    def _path_signature_id(self, include_self=True) -> Tuple[inspect.Parameter, ...]:
+        """
+        Path parameters of the ids of this router and its parents, built once and shared by all endpoints
+        """
         if include_self:
-            yield forge.kwarg(
-                self.id_field,
-                type=str,
-                default=Path(..., min_length=self.model.id.field.max_length, max_length=self.model.id.field.max_length),
-            )
+            return self._path_signature_ids
+
+        return self._path_signature_parent_ids
+
+    @cached_property
+    def _id_arg_names(self) -> Tuple[str, ...]:
+        return tuple(arg.name for arg in self._path_signature_ids)
+
+    @cached_property
+    def _parent_id_arg_names(self) -> Tuple[str, ...]:
+        return tuple(arg.name for arg in self._path_signature_parent_ids)
 
     def _get_ids(self, kwargs: dict, include_self=True) -> List[str]:
-        return [kwargs[arg.name] for arg in self._path_signature_id(include_self=include_self)]
+        return [kwargs[name] for name in (self._id_arg_names if include_self else self._parent_id_arg_names)]
 
     def depends_response_headers(self, method: Method, request: Request, response: Response):
-        if method in (Method.GET, Method.GET_LIST, Method.GET_AGGREGATE):
-            if self.cache_control:
-                response.headers['Cache-Control'] = self.cache_control.value
+        # most routers have no cache control, check it before the method
+        if self.cache_control and method in _CACHED_METHODS:
+            response.headers['Cache-Control'] = self.cache_control.value
 
         return response
 
@@ -544,9 +1017,10 @@ class DjangoRouterSchema(RouterSchema):
         **kwargs,
     ):
         ids = self._get_ids(kwargs, include_self=False)
-        return self.list(
+        # the items are already instances of the referenced schema, validating the envelope would copy each of them
+        return self.list.construct(
             items=[
-                self.get_referenced.from_orm(obj)
+                self._read_object(obj)
                 for obj in self.objects_get_filtered(
                     parent_ids=ids,
                     access=access,
@@ -557,11 +1031,13 @@ class DjangoRouterSchema(RouterSchema):
         )
 
     def search_filter(self, _request: Optional[Request] = None, **kwargs: Dict[str, Any]) -> models.Q:
-        q = models.Q()
-
         if _request:
+            fields_by_alias = self._search_filter_fields_by_alias
             used_params = [
-                field for field in self.search_filter_fields.values() if field.alias in _request.query_params
+                field
+                for _i, field in sorted(
+                    fields_by_alias[alias] for alias in _request.query_params.keys() if alias in fields_by_alias
+                )
             ]
             query_values, query_errors = request_params_to_args(used_params, _request.query_params)
 
@@ -571,33 +1047,33 @@ class DjangoRouterSchema(RouterSchema):
         else:
             query_values = kwargs
 
+        # collect all conditions into a single Q instead of combining (and copying) one Q per condition
+        children = []
         for arg, value in query_values.items():
             if value is None:
                 continue
 
             if arg.startswith('not__'):
-                query = models.Q(**{arg[5:]: value})
-                query.negate()
+                children.append(~models.Q(**{arg[5:]: value}))
 
             else:
-                query = models.Q(**{arg: value})
-
-            q &= query
+                children.append((arg, value))
 
-        if self.delete_status and 'status__in' in kwargs and kwargs['status__in'] is None:
-            q &= ~models.Q(status=self.delete_status)
+        if self._excludes_delete_status and query_values.get('status__in') is None:
+            children.append(~models.Q(status=self.delete_status))
 
-        return q
+        return models.Q(*children)
 
     def _get_field_variations(self, field: models.Field, field_name: str = None, field_type=None):
         field_type = field_type or get_field_type(field)
         field_name = field_name or field.name
         variations = [(field_name, field_type)]
+        kind = _get_field_kind(field)
 
-        if isinstance(field, models.DateTimeField):
+        if kind & FieldKind.DATETIME:
             variations.append((f'{field_name}__date', date))
 
-        if isinstance(field, (models.DateField, models.DateTimeField)):
+        if kind & FieldKind.DATE:
             for variation, type_ in [*variations]:
                 if type_ not in (date, Optional[date]):
                     continue
@@ -609,38 +1085,32 @@ class DjangoRouterSchema(RouterSchema):
                 variations.append((f'{variation}__week', int))
                 variations.append((f'{variation}__week_day', int))
 
-        if isinstance(field, (models.IntegerField, models.FloatField, models.DecimalField)):
+        if kind & FieldKind.NUMERIC:
             variations.append((f'{field_name}__sum', field_type))
-            variations.append((f'{field_name}__avg', float if isinstance(field, models.IntegerField) else field_type))
+            variations.append((f'{field_name}__avg', float if kind & FieldKind.INTEGER else field_type))
             variations.append((f'{field_name}__min', field_type))
             variations.append((f'{field_name}__max', field_type))
 
         return variations
 
-    def _search_filter_field(self, model_field) -> Generator[Tuple[str, Type, dict], None, None]:
+    def _search_filter_field(self, model_field, kind: FieldKind) -> Generator[Tuple[str, Type, dict], None, None]:
         field: models.Field = model_field.value
-        if field.name == 'tenant_id' or (getattr(field, 'primary_key', False) and self.model != field.model):
+        is_primary_key = getattr(field, 'primary_key', False)
+        if field.name == 'tenant_id' or (is_primary_key and self.model != field.model):
             return
 
         field_type = get_field_type(field)
         field_name = model_field._name_
 
         assert (
-            isinstance(
-                field,
-                (
-                    models.ManyToManyRel,
-                    models.ManyToOneRel,
-                ),
-            )
-            or field_type
+            kind & FieldKind.RELATED or field_type
         ), f'Field {field.name} on model {self.model} is missing a type annotation'
 
         query_options = {
             'default': None,
         }
 
-        if isinstance(field, (models.ForeignKey, models.ManyToManyField)):
+        if kind & (FieldKind.FOREIGN_KEY | FieldKind.MANY_TO_MANY):
             field_type = List[constr(min_length=field.max_length, max_length=field.max_length)]
             field_name += '__id'
             query_options.update(alias=field_name)
@@ -649,29 +1119,18 @@ class DjangoRouterSchema(RouterSchema):
             if self.parent and field.related_model == self.parent.model:
                 return
 
-        if isinstance(field, models.ManyToManyField):
+        if kind & FieldKind.MANY_TO_MANY:
             return
 
         if field.null:
             _name = f'{query_options.get("alias") or field_name}__isnull'
             yield _name, bool, {**query_options, 'alias': _name}
 
-        if isinstance(field, (models.ManyToManyRel, models.ManyToOneRel)):
+        if kind & FieldKind.RELATED:
             field_name += '__count'
             field_type = int
 
-        if isinstance(
-            field,
-            (
-                models.DateField,
-                models.DateTimeField,
-                models.IntegerField,
-                models.FloatField,
-                models.DecimalField,
-                models.ManyToManyRel,
-                models.ManyToOneRel,
-            ),
-        ):
+        if kind & _RANGE_FIELD_KINDS:
             for variation in self._get_field_variations(field, field_name, field_type):
                 name = variation
                 type_ = field_type
@@ -681,8 +1140,8 @@ class DjangoRouterSchema(RouterSchema):
                 yield f'{name}__gte', type_, query_options
                 yield f'{name}__lte', type_, query_options
 
-        elif isinstance(field, models.CharField):
-            if field.choices or getattr(field, 'primary_key', False):
+        elif kind & FieldKind.CHAR:
+            if kind & FieldKind.CHOICES or is_primary_key:
                 query_options['alias'] = field_name
                 if field_name == 'status' and self.delete_status:
                     query_options['description'] = (
@@ -702,24 +1161,44 @@ class DjangoRouterSchema(RouterSchema):
     def search_filter_fields(
         self,
     ) -> Dict[str, ModelField]:
+        key = (self.model, self.parent.model if self.parent else None, self.delete_status, self.model_fields_max_depth)
+        if key in _search_filter_fields:
+            return _search_filter_fields[key]
+
         fields = {}
-        for model_field in self.model_fields:
-            for name, type_, options in self._search_filter_field(model_field):
+        for model_field, kind in self._field_index.values():
+            for name, type_, options in self._search_filter_field(model_field, kind):
+                annotation = Optional[type_]
                 fields[name] = analyze_param(
                     param_name=name,
-                    annotation=Optional[type_],
+                    annotation=annotation,
                     value=Query(**options),
                     is_path_param=False,
                 )[2]
                 fields[f'not__{name}'] = analyze_param(
                     param_name=f'not__{name}',
-                    annotation=Optional[type_],
+                    annotation=annotation,
                     value=Query(**{**options, 'alias': '!' + options.get('alias', name)}),
                     is_path_param=False,
                 )[2]
 
+        _search_filter_fields[key] = fields
         return fields
 
+    @cached_property
+    def _excludes_delete_status(self) -> bool:
+        """
+        Whether objects with the `delete_status` are excluded when not explicitly searching by status
+        """
+        return bool(self.delete_status) and 'status__in' in self.search_filter_fields
+
+    @cached_property
+    def _search_filter_fields_by_alias(self) -> Dict[str, Tuple[int, ModelField]]:
+        """
+        Search filter fields by their query alias, with their position to keep the order of the filter conditions
+        """
+        return {field.alias: (i, field) for i, field in enumerate(self.search_filter_fields.values())}
+
     def create_depends_search(self):
         if self.do_include_query_fields_in_schema:
             if len(self.search_filter_fields) > 100:
@@ -727,9 +1206,9 @@ class DjangoRouterSchema(RouterSchema):
                     "Having search query fields in schema when having more then 100 fields can cause massive performance problems while processing each request"
                 )
 
-            return forge.sign(
+            return sign(
                 *[
-                    forge.kwarg(
+                    kwarg(
                         name,
                         type=field.annotation,
                         default=field.field_info,
@@ -739,29 +1218,48 @@ class DjangoRouterSchema(RouterSchema):
             )(self.search_filter)
 
         else:
-            return forge.sign(forge.kwarg('_request', type=Request))(self.search_filter)
+            return sign(kwarg('_request', type=Request))(self.search_filter)
 
     def _depends_search(self):
-        yield forge.kwarg('search', type=models.Q, default=Depends(self.create_depends_search()))
-        yield forge.kwarg(
+        yield kwarg('search', type=models.Q, default=Depends(self.create_depends_search()))
+
+        get_pagination = depends_pagination(**self.pagination_options)
+        order_by = kwarg(
+            'order_by',
+            type=Optional[List[self.order_fields]],
+            default=Query(
+                self.pagination_options.get('default_order_by', list()),
+                include_in_schema=self.do_include_query_fields_in_schema,
+            ),
+        )
+        yield kwarg(
             'pagination',
             type=Pagination,
             default=Depends(
-                forge.modify(
-                    'order_by',
-                    type=Optional[List[self.order_fields]],
-                    default=Query(
-                        self.pagination_options.get('default_order_by', list()),
-                        include_in_schema=self.do_include_query_fields_in_schema,
-                    ),
-                )(depends_pagination(**self.pagination_options))
+                sign(
+                    *[
+                        (
+                            order_by
+                            if parameter.name == 'order_by'
+                            else parameter.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+                        )
+                        for parameter in inspect.signature(get_pagination).parameters.values()
+                    ]
+                )(get_pagination)
             ),
         )
 
+    @cached_property
+    def _search_signature(self) -> Tuple[inspect.Parameter, ...]:
+        """
+        Signature of the search and pagination dependencies, signed once and shared by the list and aggregate endpoints
+        """
+        return tuple(self._depends_search())
+
     def get_endpoint_description(self, method: Method):
         description = ""
 
-        scopes = self._get_security_scopes(method)
+        scopes = self._resolved_scopes[method]
         if scopes:
             description += "Scopes: " + ", ".join([f'`{scope}`' for scope in scopes]) + "\n\n"
 
@@ -785,8 +1283,8 @@ class DjangoRouterSchema(RouterSchema):
         return description or None
 
     def signature(self, method: Method):
-        yield forge.kwarg('request', type=Request)
-        yield forge.kwarg('response', type=Response)
+        yield kwarg('request', type=Request)
+        yield kwarg('response', type=Response)
 
         yield from self._path_signature_id(
             include_self=method not in (Method.GET_LIST, Method.GET_AGGREGATE, Method.POST)
@@ -794,7 +1292,20 @@ class DjangoRouterSchema(RouterSchema):
         yield from self._security_signature(method)
 
         if method in (Method.GET_LIST, Method.GET_AGGREGATE):
-            yield from self._depends_search()
+            yield from self._search_signature
+
+    @cached_property
+    def _signatures(self) -> Dict[Method, Tuple[inspect.Parameter, ...]]:
+        return {}
+
+    def _signature(self, method: Method) -> Tuple[inspect.Parameter, ...]:
+        """
+        Shared signature of the method, materialized once per router and method
+        """
+        if method not in self._signatures:
+            self._signatures[method] = tuple(self.signature(method))
+
+        return self._signatures[method]
 
     def endpoint(self, method: Method, signature: Optional[List] = None):
         """
@@ -805,7 +1316,7 @@ class DjangoRouterSchema(RouterSchema):
 
         def wrapper(endpoint):
             try:
-                endpoint = forge.sign(*[*self.signature(method), *signature])(endpoint)
+                endpoint = sign(*self._signature(method), *signature)(endpoint)
 
             except Exception:
                 raise
@@ -835,10 +1346,24 @@ class DjangoRouterSchema(RouterSchema):
         search: models.Q = models.Q(),
         **kwargs,
     ):
+        if (aggregation_function, field) not in self._valid_aggregations:
+            error = ValueError(f'{aggregation_function.value} can not be applied to {field.value}')
+            raise RequestValidationError(_normalize_errors([ErrorWrapper(error, ('query', 'aggregation_function'))]))
+
         ids = self._get_ids(kwargs, include_self=False)
+        if self.parent:
+            # an aggregate over no rows still yields values, a missing parent would go unnoticed
+            self._check_parent_exists(ids, access=access)
+
+        lookups = {
+            field.value,
+            *(field.value for field in group_by or []),
+            *pagination.order_by_fields,
+            *_get_lookups(search),
+        }
 
         return aggregation(
-            self.get_queryset(ids, access, is_annotated=True, is_aggregated=True),
+            self.get_queryset(ids, access, is_annotated=lookups, is_aggregated=True),
             q_filters=search,
             aggregation_function=aggregation_function,
             field=field,
@@ -851,10 +1376,10 @@ class DjangoRouterSchema(RouterSchema):
         return self.endpoint(
             Method.GET_AGGREGATE,
             signature=[
-                forge.kwarg('aggregation_function', type=AggregationFunction, default=Path(...)),
-                forge.kwarg('field', type=self.aggregated_fields, default=Path(...)),
+                kwarg('aggregation_function', type=AggregationFunction, default=Path(...)),
+                kwarg('field', type=self.aggregated_fields, default=Path(...)),
                 (
-                    forge.kwarg('group_by', type=Optional[List[self.get_aggregate_group_by]], default=Query(None))
+                    kwarg('group_by', type=Optional[List[self.get_aggregate_group_by]], default=Query(None))
                     if self.aggregate_group_by is not ...
                     else None
                 ),
@@ -862,20 +1387,20 @@ class DjangoRouterSchema(RouterSchema):
         )(self.endpoint_aggregate)
 
     def endpoint_post(self, *, data: TCreateModel, access: Optional[Access] = None, **kwargs):
-        obj = self.object_create(
-            access=access, data=data, parent_id=kwargs[self.parent.id_field] if self.parent else None
-        )
-        if len(obj) > 1:
+        parent_id = kwargs[self.parent.id_field] if self.parent else None
+        if isinstance(data, list):
+            obj = self.object_create(access=access, data=data, parent_id=parent_id)
             return [self.get_referenced.from_orm(o) for o in obj]
 
-        return self.get_referenced.from_orm(obj[0])
+        obj = self.object_create_one(access=access, data=data, parent_id=parent_id)
+        return self.get_referenced.from_orm(obj)
 
     def _create_endpoint_post(self):
         create_type = self.create
         if self.create_multi:
             create_type = List[self.create]
 
-        return self.endpoint(Method.POST, signature=[forge.kwarg('data', type=create_type, default=Body(...))])(
+        return self.endpoint(Method.POST, signature=[kwarg('data', type=create_type, default=Body(...))])(
             self.endpoint_post
         )
 
@@ -885,7 +1410,7 @@ class DjangoRouterSchema(RouterSchema):
 
     def endpoint_get(self, *, access: Optional[Access] = None, **kwargs):
         obj = self._object_get(kwargs, access=access)
-        return self.get_referenced.from_orm(obj)
+        return self._read_object(obj)
 
     def _create_endpoint_get(self):
         return self.endpoint(Method.GET)(self.endpoint_get)
@@ -899,7 +1424,7 @@ class DjangoRouterSchema(RouterSchema):
         return self.endpoint(
             Method.PATCH,
             signature=[
-                forge.kwarg('data', type=self.update_optional, default=Body(...)),
+                kwarg('data', type=self.update_optional, default=Body(...)),
             ],
         )(self.endpoint_patch)
 
@@ -912,7 +1437,7 @@ class DjangoRouterSchema(RouterSchema):
         return self.endpoint(
             Method.PUT,
             signature=[
-                forge.kwarg('data', type=self.update_id_added, default=Body(...)),
+                kwarg('data', type=self.update_id_added, default=Body(...)),
             ],
         )(self.endpoint_put)
 
@@ -1,11 +1,16 @@
+from typing import Union
 from starlette.applications import Starlette
 from starlette.routing import Router
+from .base import RouterSchema
 
 
-routers: dict[int, tuple[Router, list, dict]] = {}
+routers: dict[int, tuple[Union[Router, RouterSchema], list, dict]] = {}
 
 
-def register_router(router: Router, *args, **kwargs):
+def register_router(router: Union[Router, RouterSchema], *args, **kwargs):
+    """
+    Register a router to be included into the app, a router schema can be given to defer the creation of its router
+    """
     if id(router) in routers:
         raise ValueError(f"Router {router} already registered")
 
@@ -14,4 +19,7 @@ def register_router(router: Router, *args, **kwargs):
 
 def include_routers(app: Starlette):
     for router, args, kwargs in routers.values():
+        if not isinstance(router, Router):
+            router = router.router
+
         app.include_router(router, *args, **kwargs)
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List, Tuple, Union
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper
 from django.db.models import Q, QuerySet
@@ -12,6 +12,13 @@ class Pagination(BaseModel):
     offset: int
     order_by: List[str]
 
+    @property
+    def order_by_fields(self) -> Tuple[str, ...]:
+        """
+        Fields of order_by without the descending prefix.
+        """
+        return tuple(field.removeprefix('-') for field in self.order_by)
+
     def query(self, objects: Union[BaseManager, QuerySet], q_filters: Q = Q()) -> QuerySet:
         """
         Filter a given model's BaseManager or pre-filtered Queryset with the given q_filters and apply order_by and offset/limit from the pagination.
@@ -1,4 +1,6 @@
-from typing import List, Optional
+import inspect
+from functools import wraps
+from typing import Any, List, Optional
 from enum import Enum
 from fastapi import Query
 from ..schemas import Pagination
@@ -8,6 +10,38 @@ class CacheControl(Enum):
     NO_CACHE = 'no-cache'
 
 
+def kwarg(name: str, type: Any = inspect.Parameter.empty, default: Any = inspect.Parameter.empty) -> inspect.Parameter:
+    """
+    Keyword only parameter to be used with `sign`
+    """
+    return inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=type)
+
+
+def sign(*parameters: Optional[inspect.Parameter]):
+    """
+    Decorates a callable which is only invoked with keyword arguments (as done by FastAPI) and sets its signature
+    """
+    signature = inspect.Signature([parameter for parameter in parameters if parameter])
+
+    def wrapper(func):
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def signed(**kwargs):
+                return await func(**kwargs)
+
+        else:
+
+            @wraps(func)
+            def signed(**kwargs):
+                return func(**kwargs)
+
+        signed.__signature__ = signature
+        return signed
+
+    return wrapper
+
+
 def depends_pagination(max_limit: Optional[int] = 1000, default_order_by: Optional[List[str]] = None):
     def get_pagination(
         limit: Optional[int] = Query(None, le=max_limit, ge=1),
@@ -1,12 +1,12 @@
-from decimal import Decimal
 from functools import wraps
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from enum import Enum
-from pydantic import BaseModel, Extra
+from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper
 from django.db.models import Q, QuerySet, Manager, aggregates
 from django.db.utils import ProgrammingError
 from django.core import signals
+from fastapi._compat import _normalize_errors
 from fastapi.exceptions import RequestValidationError
 from .fastapi import Pagination
 
@@ -29,11 +29,20 @@ class AggregationFunction(Enum):
     sum = 'sum'
 
 
-class AggregateResponse(BaseModel):
-    class Value(BaseModel, extra=Extra.allow):
-        value: Union[int, float, Decimal]
+# aggregate classes by function, resolved once instead of on every aggregation
+_aggregate_functions = {function.value: getattr(aggregates, function.value.title()) for function in AggregationFunction}
+
+
+def get_aggregate_function(aggregation_function: Enum) -> type:
+    if aggregation_function.value not in _aggregate_functions:
+        _aggregate_functions[aggregation_function.value] = getattr(aggregates, aggregation_function.value.title())
 
-    values: List[Value]
+    return _aggregate_functions[aggregation_function.value]
+
+
+class AggregateResponse(BaseModel):
+    # rows are returned as they are selected (`value` and the group by fields), without a model per row
+    values: List[Dict[str, Any]]
 
 
 def aggregation(
@@ -50,15 +59,10 @@ def aggregation(
         query = objects.filter(q_filters)
         fields = []
         if distinct and field.value == '*':
-            raise RequestValidationError(
-                [ErrorWrapper(ValueError(), ('query', 'distinct'))]
-            )
+            raise RequestValidationError(_normalize_errors([ErrorWrapper(ValueError(), ('query', 'distinct'))]))
 
         annotations = {
-            'value': getattr(
-                aggregates,
-                aggregation_function.value.title()
-            )(field.value, distinct=distinct),
+            'value': get_aggregate_function(aggregation_function)(field.value, distinct=distinct),
         }
 
         try:
@@ -76,7 +80,7 @@ def aggregation(
                 UNDEFINED_FUNCTION and error.__cause__.pgcode == UNDEFINED_FUNCTION
             ):
                 raise RequestValidationError(
-                    [ErrorWrapper(ProgrammingError(), ('query', 'aggregation_function'))]
+                    _normalize_errors([ErrorWrapper(ProgrammingError(), ('query', 'aggregation_function'))])
                 ) from error
 
             raise
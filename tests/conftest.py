@@ -0,0 +1,49 @@
+import os
+import tempfile
+
+import django
+import pytest
+from django.conf import settings
+
+
+def pytest_configure():
+    # endpoints run in a threadpool, every thread would get its own in memory database
+    database = os.path.join(tempfile.mkdtemp(), 'db.sqlite3')
+    settings.configure(
+        INSTALLED_APPS=['tests.testapp'],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': database}},
+        USE_TZ=True,
+    )
+    django.setup()
+
+    from django.core.management import call_command
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    yield
+
+    from django.apps import apps
+
+    for model in apps.get_app_config('testapp').get_models():
+        model.objects.all().delete()
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """
+    SQL of all executed queries, endpoints run in a threadpool with their own database connection
+    """
+    from django.db.backends.utils import CursorWrapper
+
+    executed = []
+    execute = CursorWrapper.execute
+
+    def record(self, sql, params=None):
+        executed.append(sql)
+        return execute(self, sql, params)
+
+    monkeypatch.setattr(CursorWrapper, 'execute', record)
+    return executed
@@ -0,0 +1,59 @@
+from django.core.exceptions import ObjectDoesNotExist
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.handlers.error import object_does_not_exist_handler
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company, Employee
+
+
+def test_aggregate_nested_router_after_top_level_router():
+    # the top level router builds its enums first, the nested router must not reuse them
+    employees = DjangoRouterSchema(name='employees', model=models.Employee, get=Employee)
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        children=[DjangoRouterSchema(name='employees', model=models.Employee, get=Employee)],
+    )
+
+    app = FastAPI()
+    app.include_router(employees.router)
+    app.include_router(companies.router)
+    client = TestClient(app)
+
+    company = models.Company.objects.create(name='A')
+    for salary in (10, 20):
+        models.Employee.objects.create(company=company, name='e', salary=salary)
+
+    response = client.get(f'/companies/{company.id}/employees/aggregate/sum/salary')
+    assert response.status_code == 200
+    assert response.json() == {'values': [{'value': 30}]}
+
+    response = client.get(f'/companies/{company.id}/employees/aggregate/count/*')
+    assert response.status_code == 200
+    assert response.json() == {'values': [{'value': 2}]}
+
+    response = client.get('/employees/aggregate/count/*')
+    assert response.status_code == 200
+
+    assert client.get('/openapi.json').status_code == 200
+
+
+def test_aggregate_missing_parent():
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        children=[DjangoRouterSchema(name='employees', model=models.Employee, get=Employee)],
+    )
+
+    app = FastAPI()
+    app.add_exception_handler(ObjectDoesNotExist, object_does_not_exist_handler)
+    app.include_router(companies.router)
+    client = TestClient(app)
+
+    response = client.get(f'/companies/{"9" * 16}/employees/aggregate/count/*')
+    assert response.status_code == 404
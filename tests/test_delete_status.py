@@ -0,0 +1,53 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company
+
+
+@pytest.fixture(params=[False, True], ids=['request', 'query_fields_in_schema'])
+def client(request):
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        delete_status='deleted',
+        do_include_query_fields_in_schema=request.param,
+    )
+
+    app = FastAPI()
+    app.include_router(companies.router)
+
+    models.Company.objects.create(name='A')
+    models.Company.objects.create(name='B', status='deleted')
+
+    return TestClient(app)
+
+
+def test_list_excludes_delete_status(client):
+    response = client.get('/companies')
+    assert response.status_code == 200
+    assert [company['name'] for company in response.json()['items']] == ['A']
+
+
+def test_list_searched_by_status(client):
+    response = client.get('/companies?status=deleted')
+    assert response.status_code == 200
+    assert [company['name'] for company in response.json()['items']] == ['B']
+
+    response = client.get('/companies?status=active&status=deleted&order_by=name')
+    assert response.status_code == 200
+    assert [company['name'] for company in response.json()['items']] == ['A', 'B']
+
+
+def test_aggregate_excludes_delete_status(client):
+    response = client.get('/companies/aggregate/count/*')
+    assert response.status_code == 200
+    assert response.json() == {'values': [{'value': 1}]}
+
+    response = client.get('/companies/aggregate/count/*?status=deleted')
+    assert response.status_code == 200
+    assert response.json() == {'values': [{'value': 1}]}
@@ -0,0 +1,63 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company, Employee, EmployeeWithCompany
+
+
+def create_client(fast_read: bool, employee_schema=Employee):
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        fast_read=fast_read,
+        children=[
+            DjangoRouterSchema(name='employees', model=models.Employee, get=employee_schema, fast_read=fast_read)
+        ],
+    )
+
+    app = FastAPI()
+    app.include_router(companies.router)
+    return TestClient(app)
+
+
+def get_payloads(client, company, employee):
+    return [
+        client.get(url).json()
+        for url in (
+            '/companies',
+            f'/companies/{company.id}',
+            f'/companies/{company.id}/employees',
+            f'/companies/{company.id}/employees/{employee.id}',
+        )
+    ]
+
+
+def test_fast_read_payload():
+    company = models.Company.objects.create(name='A')
+    employee = models.Employee.objects.create(company=company, name='a', salary='10.50')
+    models.Employee.objects.create(company=company, name='b', salary=20)
+
+    employees = DjangoRouterSchema(name='employees', model=models.Employee, get=Employee)
+    assert employees._fast_read_attributes == (('id', 'id'), ('name', 'name'), ('salary', 'salary'))
+
+    payloads = get_payloads(create_client(fast_read=False), company, employee)
+    assert payloads[3] == {'id': employee.id, 'name': 'a', 'salary': 10.5}
+    assert get_payloads(create_client(fast_read=True), company, employee) == payloads
+
+
+def test_fast_read_nested_schema():
+    # schemas with submodels are still transferred by transfer_from_orm
+    employees = DjangoRouterSchema(name='employees', model=models.Employee, get=EmployeeWithCompany)
+    assert employees._fast_read_attributes is None
+
+    company = models.Company.objects.create(name='A')
+    employee = models.Employee.objects.create(company=company, name='a')
+
+    payloads = get_payloads(create_client(fast_read=False, employee_schema=EmployeeWithCompany), company, employee)
+    assert payloads[3]['company'] == {'id': company.id, 'name': 'A'}
+    assert (
+        get_payloads(create_client(fast_read=True, employee_schema=EmployeeWithCompany), company, employee) == payloads
+    )
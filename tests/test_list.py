@@ -0,0 +1,55 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company, EmployeeWithCompany
+
+
+def create_client(**options):
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        children=[DjangoRouterSchema(name='employees', model=models.Employee, get=EmployeeWithCompany, **options)],
+        **options,
+    )
+
+    app = FastAPI()
+    app.include_router(companies.router)
+    return TestClient(app)
+
+
+def test_list_queries(queries):
+    client = create_client()
+    company = models.Company.objects.create(name='A', notes='not read by the get schema')
+    for name in ('a', 'b', 'c'):
+        models.Employee.objects.create(company=company, name=name)
+
+    queries.clear()
+    response = client.get('/companies')
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['items']] == ['A']
+    assert len(queries) == 1
+    assert 'notes' not in queries[0]
+
+    queries.clear()
+    response = client.get(f'/companies/{company.id}/employees?order_by=name')
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['items']] == ['a', 'b', 'c']
+    # the page and the parent of all its objects, not a query per row
+    assert len(queries) == 2
+    assert 'salary' not in queries[0]
+
+
+def test_list_only_fields_disabled(queries):
+    client = create_client(list_only_fields=False)
+    company = models.Company.objects.create(name='A')
+
+    queries.clear()
+    response = client.get('/companies')
+    assert response.status_code == 200
+    assert [item['id'] for item in response.json()['items']] == [company.id]
+    assert len(queries) == 1
+    assert 'notes' in queries[0]
@@ -0,0 +1,48 @@
+from django.core.exceptions import ObjectDoesNotExist
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.handlers.error import object_does_not_exist_handler
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company, EmployeeWithCompany
+
+
+def create_client(**options):
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        children=[DjangoRouterSchema(name='employees', model=models.Employee, get=EmployeeWithCompany, **options)],
+    )
+
+    app = FastAPI()
+    app.add_exception_handler(ObjectDoesNotExist, object_does_not_exist_handler)
+    app.include_router(companies.router)
+    return TestClient(app)
+
+
+def test_streamed_page(queries):
+    company = models.Company.objects.create(name='A')
+    for name in 'abcde':
+        models.Employee.objects.create(company=company, name=name)
+
+    url = f'/companies/{company.id}/employees?order_by=name&limit=4&offset=1'
+    client, streamed_client = create_client(), create_client(list_chunk_size=2)
+
+    queries.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    assert [item['name'] for item in response.json()['items']] == ['b', 'c', 'd', 'e']
+    assert len(queries) == 2
+
+    # pages larger than list_chunk_size are streamed, the parent is prefetched per chunk
+    queries.clear()
+    assert streamed_client.get(url).json() == response.json()
+    assert len(queries) == 3
+
+
+def test_streamed_page_missing_parent():
+    response = create_client(list_chunk_size=2).get(f'/companies/{"9" * 16}/employees')
+    assert response.status_code == 404
@@ -0,0 +1,36 @@
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company
+
+COMPANY_FIELDS = {'id', 'name', 'status', 'notes', 'employees'}
+EMPLOYEE_FIELDS = {f'employees__{field}' for field in ('id', 'company', 'name', 'salary', 'tags')}
+TAG_FIELDS = {'employees__tags__id', 'employees__tags__name', 'employees__tags__employees'}
+
+
+def get_model_fields(**options):
+    router = DjangoRouterSchema(name='companies', model=models.Company, get=Company, **options)
+    return {field.name for field in router.model_fields}
+
+
+def test_model_fields():
+    # relations back to a model on the path are not walked again
+    assert get_model_fields() == COMPANY_FIELDS | EMPLOYEE_FIELDS | TAG_FIELDS
+
+
+def test_model_fields_max_depth():
+    assert get_model_fields(model_fields_max_depth=0) == COMPANY_FIELDS
+    assert get_model_fields(model_fields_max_depth=1) == COMPANY_FIELDS | EMPLOYEE_FIELDS
+    assert get_model_fields(model_fields_max_depth=2) == COMPANY_FIELDS | EMPLOYEE_FIELDS | TAG_FIELDS
+
+
+def test_model_fields_max_depth_enum_names():
+    routers = [
+        DjangoRouterSchema(name='companies', model=models.Company, get=Company, model_fields_max_depth=depth)
+        for depth in (None, 0, 1)
+    ]
+    assert [router.model_fields.__name__ for router in routers] == [
+        'CompanyFields',
+        'CompanyDepth0Fields',
+        'CompanyDepth1Fields',
+    ]
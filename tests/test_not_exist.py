@@ -0,0 +1,42 @@
+import pytest
+from django.core.exceptions import ObjectDoesNotExist
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from djfapi.handlers.error import object_does_not_exist_handler
+from djfapi.routing.django import DjangoRouterSchema
+
+from .testapp import models
+from .testapp.schemas import Company, Employee, EmployeeUpdate
+
+
+@pytest.fixture
+def client():
+    companies = DjangoRouterSchema(
+        name='companies',
+        model=models.Company,
+        get=Company,
+        children=[DjangoRouterSchema(name='employees', model=models.Employee, get=Employee, update=EmployeeUpdate)],
+    )
+
+    app = FastAPI()
+    app.add_exception_handler(ObjectDoesNotExist, object_does_not_exist_handler)
+    app.include_router(companies.router)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize('method', ['get', 'patch', 'delete'])
+def test_missing_parent(client, method):
+    company = models.Company.objects.create(name='A')
+    employee = models.Employee.objects.create(company=company, name='a')
+    kwargs = {'json': {'name': 'b'}} if method == 'patch' else {}
+
+    response = client.request(method, f'/companies/{"9" * 16}/employees/{employee.id}', **kwargs)
+    assert response.status_code == 404
+    assert response.json()['detail']['code'] == 'not_exist:company'
+
+    response = client.request(method, f'/companies/{company.id}/employees/{"9" * 16}', **kwargs)
+    assert response.status_code == 404
+    assert response.json()['detail']['code'] == 'not_exist:employee'
+
+    assert models.Employee.objects.get(pk=employee.pk).name == 'a'
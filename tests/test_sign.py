@@ -0,0 +1,20 @@
+import asyncio
+import inspect
+
+from djfapi.utils.fastapi import kwarg, sign
+
+
+def test_sign_sync():
+    signed = sign(kwarg('value', type=int))(lambda value: value + 1)
+    assert list(inspect.signature(signed).parameters) == ['value']
+    assert signed(value=1) == 2
+
+
+def test_sign_coroutine_function():
+    async def increment(value):
+        return value + 1
+
+    signed = sign(kwarg('value', type=int), None)(increment)
+    assert inspect.iscoroutinefunction(signed)
+    assert list(inspect.signature(signed).parameters) == ['value']
+    assert asyncio.run(signed(value=1)) == 2
@@ -0,0 +1,29 @@
+from itertools import count
+
+from django.db import models
+
+_ids = count()
+
+
+def generate_id():
+    return '%016d' % next(_ids)
+
+
+class Company(models.Model):
+    id = models.CharField(max_length=16, primary_key=True, default=generate_id)
+    name = models.CharField(max_length=50)
+    status = models.CharField(max_length=10, choices=[('active', 'active'), ('deleted', 'deleted')], default='active')
+    notes = models.TextField(default='')
+
+
+class Tag(models.Model):
+    id = models.CharField(max_length=16, primary_key=True, default=generate_id)
+    name = models.CharField(max_length=50)
+
+
+class Employee(models.Model):
+    id = models.CharField(max_length=16, primary_key=True, default=generate_id)
+    company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='employees')
+    name = models.CharField(max_length=50)
+    salary = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    tags = models.ManyToManyField(Tag, related_name='employees')
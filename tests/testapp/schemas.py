@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+from djdantic import BaseModel
+from djdantic.fields import Field
+
+from . import models
+
+
+class Employee(BaseModel):
+    id: str = Field(orm_field=models.Employee.id)
+    name: str = Field(orm_field=models.Employee.name)
+    salary: Decimal = Field(orm_field=models.Employee.salary)
+
+
+class Company(BaseModel):
+    id: str = Field(orm_field=models.Company.id)
+    name: str = Field(orm_field=models.Company.name)
+    status: str = Field(orm_field=models.Company.status)
+
+
+class CompanyRef(BaseModel):
+    id: str = Field(orm_field=models.Company.id)
+    name: str = Field(orm_field=models.Company.name)
+
+
+class EmployeeWithCompany(BaseModel):
+    id: str = Field(orm_field=models.Employee.id)
+    company: CompanyRef = Field(orm_field=models.Employee.company)
+    name: str = Field(orm_field=models.Employee.name)
+
+
+class EmployeeUpdate(BaseModel):
+    name: str = Field(orm_field=models.Employee.name)